@@ -6,7 +6,7 @@
  * Usage:
  *   - As MCP: Run without args, speaks JSON-RPC
  *   - As API: import { extractYouTube, extractReddit, ... } from './index'
- *   - As CLI: node index.ts <url> [output]
+ *   - As CLI: node index.ts <url> [url...] [output]
  */
 
 import { Server } from "@modelcontextprotocol/sdk/server/index.js";
@@ -14,6 +14,7 @@ import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js"
 import { CallToolRequestSchema, ListToolsRequestSchema } from "@modelcontextprotocol/sdk/types.js";
 import { YoutubeTranscript } from "youtube-transcript";
 import { writeFileSync, existsSync, statSync, mkdirSync } from "fs";
+import { readFile, writeFile, stat, mkdir } from "fs/promises";
 import { exec } from "child_process";
 import { promisify } from "util";
 import { config } from "dotenv";
@@ -22,15 +23,15 @@ import { dirname, join } from "path";
 import { homedir } from "os";
 import * as cheerio from "cheerio";
 import { decode } from "html-entities";
-import { Readability } from "@mozilla/readability";
-import { JSDOM } from "jsdom";
-import TurndownService from "turndown";
+import type TurndownService from "turndown";
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 config({ path: join(__dirname, "..", ".env") });
 
 const execAsync = promisify(exec);
 const DEFAULT_OUTPUT_DIR = join(homedir(), ".rudi", "output");
+const CACHE_DIR = join(homedir(), ".rudi", "cache", "content-extractor");
+const TRANSCRIPT_CACHE_TTL_MS = 24 * 60 * 60 * 1000;
 
 // =============================================================================
 // UTILITIES
@@ -40,11 +41,15 @@ function slugify(text: string): string {
   return text.toLowerCase().replace(/[^a-z0-9]+/g, "-").replace(/^-|-$/g, "").slice(0, 50);
 }
 
+function isDirectoryOutput(output: string): boolean {
+  if (existsSync(output) && statSync(output).isDirectory()) return true;
+  return output.endsWith("/") || !output.includes(".");
+}
+
 function resolveOutputPath(output: string | undefined, prefix: string, name: string): string {
   const filename = `${prefix}-${slugify(name)}-${new Date().toISOString().split("T")[0]}.md`;
   if (!output) return join(DEFAULT_OUTPUT_DIR, filename);
-  if (existsSync(output) && statSync(output).isDirectory()) return join(output, filename);
-  if (output.endsWith("/") || !output.includes(".")) return join(output, filename);
+  if (isDirectoryOutput(output)) return join(output, filename);
   return output;
 }
 
@@ -153,6 +158,38 @@ async function getYouTubeTranscriptViaHTML(videoId: string) {
   }
 }
 
+// Transcripts depend only on the video and the Supadata path costs credits,
+// so successful extractions are kept on disk for TRANSCRIPT_CACHE_TTL_MS
+interface CachedTranscript {
+  method: string;
+  transcript: string;
+}
+
+function transcriptCachePath(videoId: string): string {
+  return join(CACHE_DIR, `youtube-${videoId}.json`);
+}
+
+async function readTranscriptCache(videoId: string): Promise<CachedTranscript | null> {
+  try {
+    const file = transcriptCachePath(videoId);
+    const { mtimeMs } = await stat(file);
+    if (Date.now() - mtimeMs > TRANSCRIPT_CACHE_TTL_MS) return null;
+    const cached = JSON.parse(await readFile(file, "utf-8"));
+    return cached.transcript ? cached : null;
+  } catch {
+    return null;
+  }
+}
+
+async function writeTranscriptCache(videoId: string, entry: CachedTranscript): Promise<void> {
+  try {
+    await mkdir(CACHE_DIR, { recursive: true });
+    await writeFile(transcriptCachePath(videoId), JSON.stringify(entry), "utf-8");
+  } catch {
+    // Cache is best-effort
+  }
+}
+
 async function getYouTubeMetadata(videoId: string) {
   try {
     const response = await fetch(`https://www.youtube.com/watch?v=${videoId}`, {
@@ -180,9 +217,16 @@ async function getYouTubeMetadata(videoId: string) {
 
 export async function extractYouTube(url: string): Promise<YouTubeResult> {
   const videoId = extractVideoId(url);
-  const metadata = await getYouTubeMetadata(videoId);
+  // Metadata doesn't depend on the transcript; fetch it while transcript strategies run
+  const metadataTask = getYouTubeMetadata(videoId);
 
   const methods = [
+    async () => {
+      const cached = await readTranscriptCache(videoId);
+      return cached
+        ? { success: true, method: `${cached.method} (cached)`, transcript: cached.transcript }
+        : { success: false, error: "Not cached" };
+    },
     () => getYouTubeTranscriptViaSupaData(videoId, url),
     () => getYouTubeTranscriptViaAPI(videoId),
     () => getYouTubeTranscriptViaHTML(videoId),
@@ -191,7 +235,11 @@ export async function extractYouTube(url: string): Promise<YouTubeResult> {
   for (const method of methods) {
     const result = await method();
     if (result.success && result.transcript) {
+      if (result.method && !result.method.endsWith("(cached)")) {
+        await writeTranscriptCache(videoId, { method: result.method, transcript: result.transcript });
+      }
       const wordCount = result.transcript.split(/\s+/).filter((w) => w.length > 0).length;
+      const metadata = await metadataTask;
       return {
         ...metadata,
         duration: metadata.duration ? `${Math.floor(metadata.duration / 60)}m ${metadata.duration % 60}s` : "Unknown",
@@ -203,6 +251,7 @@ export async function extractYouTube(url: string): Promise<YouTubeResult> {
     }
   }
 
+  const metadata = await metadataTask;
   return {
     ...metadata,
     duration: metadata.duration ? `${Math.floor(metadata.duration / 60)}m ${metadata.duration % 60}s` : "Unknown",
@@ -414,13 +463,24 @@ export interface ArticleResult {
   wordCount: number;
 }
 
-function htmlToMarkdown(html: string): string {
-  const turndownService = new TurndownService({ headingStyle: "atx", codeBlockStyle: "fenced", bulletListMarker: "-" });
-  turndownService.addRule("removeMedia", { filter: ["img", "video", "iframe"], replacement: () => "" });
+// The converter's options and rules never change, so build it once per process
+let turndownService: TurndownService | null = null;
+
+async function htmlToMarkdown(html: string): Promise<string> {
+  if (!turndownService) {
+    const { default: Turndown } = await import("turndown");
+    turndownService = new Turndown({ headingStyle: "atx", codeBlockStyle: "fenced", bulletListMarker: "-" });
+    turndownService.addRule("removeMedia", { filter: ["img", "video", "iframe"], replacement: () => "" });
+  }
   return turndownService.turndown(html);
 }
 
 export async function extractArticle(url: string): Promise<ArticleResult> {
+  // jsdom and Readability are slow to load; only the article path pays for them,
+  // and loading starts now so it overlaps the page fetch
+  const parsersTask = Promise.all([import("jsdom"), import("@mozilla/readability"), import("turndown")]);
+  parsersTask.catch(() => {}); // surfaced where it is awaited below
+
   const response = await fetch(url, {
     headers: { "User-Agent": ARTICLE_USER_AGENT, Accept: "text/html" },
     redirect: "follow",
@@ -436,13 +496,14 @@ export async function extractArticle(url: string): Promise<ArticleResult> {
     html = html.replace(/<!--([\s\S]*?)-->/g, "$1");
   }
 
+  const [{ JSDOM }, { Readability }] = await parsersTask;
   const dom = new JSDOM(html, { url: finalUrl });
   const reader = new Readability(dom.window.document);
   const article = reader.parse();
 
   if (!article) throw new Error("Could not parse article");
 
-  const markdown = htmlToMarkdown(article.content);
+  const markdown = await htmlToMarkdown(article.content);
   const cleanText = markdown.replace(/\n{3,}/g, "\n\n").trim();
   const wordCount = cleanText.split(/\s+/).filter((w) => w.length > 0).length;
   const domain = new URL(finalUrl).hostname.replace("www.", "");
@@ -586,58 +647,83 @@ function detectPlatform(url: string): string | null {
   return null;
 }
 
+async function extractForCli(url: string, platform: string, output?: string) {
+  switch (platform) {
+    case "youtube": {
+      const data = await extractYouTube(url);
+      return { result: formatYouTubeResult(data), outputPath: output && resolveOutputPath(output, "youtube", data.title) };
+    }
+    case "reddit": {
+      const data = await extractReddit(url);
+      return { result: formatRedditResult(data), outputPath: output && resolveOutputPath(output, "reddit", data.title) };
+    }
+    case "tiktok": {
+      const data = await extractTikTok(url);
+      return { result: formatTikTokResult(data), outputPath: output && resolveOutputPath(output, "tiktok", data.metadata.user) };
+    }
+    case "article": {
+      const data = await extractArticle(url);
+      return { result: formatArticleResult(data), outputPath: output && resolveOutputPath(output, "article", data.title) };
+    }
+    default:
+      throw new Error("Unknown platform");
+  }
+}
+
 // CLI mode
 if (cliArgs.length > 0 && cliArgs[0] !== "--mcp") {
-  const url = cliArgs[0];
-  const output = cliArgs[1];
-  const platform = detectPlatform(url);
+  // Every argument is a URL, except an optional trailing output path
+  const last = cliArgs[cliArgs.length - 1];
+  const output = cliArgs.length > 1 && !detectPlatform(last) ? last : undefined;
+  const urls = output ? cliArgs.slice(0, -1) : cliArgs;
+
+  const unknown = urls.filter((arg) => !detectPlatform(arg));
+  if (unknown.length > 0) {
+    console.error(`Could not detect platform from URL: ${unknown.join(", ")}`);
+    process.exit(1);
+  }
 
-  if (!platform) {
-    console.error("Could not detect platform from URL");
+  if (urls.length > 1 && output && !isDirectoryOutput(output)) {
+    console.error("Output must be a directory when extracting several URLs");
     process.exit(1);
   }
 
   (async () => {
     try {
-      let result: string;
-      let outputPath: string | undefined;
-
-      switch (platform) {
-        case "youtube": {
-          const data = await extractYouTube(url);
-          result = formatYouTubeResult(data);
-          if (output) outputPath = resolveOutputPath(output, "youtube", data.title);
-          break;
-        }
-        case "reddit": {
-          const data = await extractReddit(url);
-          result = formatRedditResult(data);
-          if (output) outputPath = resolveOutputPath(output, "reddit", data.title);
-          break;
-        }
-        case "tiktok": {
-          const data = await extractTikTok(url);
-          result = formatTikTokResult(data);
-          if (output) outputPath = resolveOutputPath(output, "tiktok", data.metadata.user);
-          break;
+      // Several URLs are extracted concurrently in this one process
+      const outcomes = await Promise.allSettled(
+        urls.map((url) => extractForCli(url, detectPlatform(url)!, output))
+      );
+
+      // Results can slug to the same file name (e.g. several TikToks by one creator);
+      // number repeats so no result in this run overwrites another
+      const usedPaths = new Set<string>();
+      const uniquePath = (path: string) => {
+        let candidate = path;
+        for (let n = 2; usedPaths.has(candidate); n++) candidate = path.replace(/(\.md)?$/, `-${n}$1`);
+        usedPaths.add(candidate);
+        return candidate;
+      };
+
+      let failed = false;
+      outcomes.forEach((outcome, i) => {
+        if (outcome.status === "rejected") {
+          failed = true;
+          console.error(urls.length > 1 ? `Error (${urls[i]}):` : "Error:", outcome.reason?.message);
+          return;
         }
-        case "article": {
-          const data = await extractArticle(url);
-          result = formatArticleResult(data);
-          if (output) outputPath = resolveOutputPath(output, "article", data.title);
-          break;
+        const { result } = outcome.value;
+        const outputPath = outcome.value.outputPath && uniquePath(outcome.value.outputPath);
+        if (outputPath) {
+          ensureOutputDir();
+          writeFileSync(outputPath, result, "utf-8");
+          console.log(`Saved to ${outputPath}`);
+        } else {
+          console.log(result);
         }
-        default:
-          throw new Error("Unknown platform");
-      }
+      });
 
-      if (outputPath) {
-        ensureOutputDir();
-        writeFileSync(outputPath, result, "utf-8");
-        console.log(`Saved to ${outputPath}`);
-      } else {
-        console.log(result);
-      }
+      if (failed) process.exit(1);
     } catch (error: any) {
       console.error("Error:", error.message);
       process.exit(1);
@@ -0,0 +1,210 @@
+/**
+ * Google batch wire format tests
+ *
+ * Pins the multipart/mixed request encoding and the Content-ID to
+ * request-index mapping of batch responses, including chunks that fail.
+ */
+
+import { describe, it, expect, vi, afterEach } from "vitest";
+import { BATCH_LIMIT, batchRequest, buildBatchBody, parseBatchResponse } from "./batch.js";
+
+// =============================================================================
+// Test Fixtures
+// =============================================================================
+
+// Shape of a real www.googleapis.com/batch response: parts arrive in any
+// order, the boundary contains '=' and '-', and a 204 has no body
+const RESPONSE_BOUNDARY = "batch_pK7JBAk73-E=_AA5eFwv4m2Q=";
+const RESPONSE_CONTENT_TYPE = `multipart/mixed; boundary=${RESPONSE_BOUNDARY}`;
+
+const capturedResponse = [
+  `--${RESPONSE_BOUNDARY}`,
+  "Content-Type: application/http",
+  "Content-ID: <response-item1>",
+  "",
+  "HTTP/1.1 204 No Content",
+  "Content-Length: 0",
+  "",
+  "",
+  `--${RESPONSE_BOUNDARY}`,
+  "Content-Type: application/http",
+  "Content-ID: <response-item0>",
+  "",
+  "HTTP/1.1 200 OK",
+  "Content-Type: application/json; charset=UTF-8",
+  "Vary: Origin",
+  "",
+  "{",
+  ' "kind": "calendar#event",',
+  ' "id": "evt123",',
+  ' "summary": "Standup"',
+  "}",
+  "",
+  `--${RESPONSE_BOUNDARY}`,
+  "Content-Type: application/http",
+  "Content-ID: <response-item2>",
+  "",
+  "HTTP/1.1 404 Not Found",
+  "Content-Type: application/json; charset=UTF-8",
+  "",
+  "{",
+  ' "error": {',
+  '  "code": 404,',
+  '  "message": "Not Found"',
+  " }",
+  "}",
+  "",
+  `--${RESPONSE_BOUNDARY}--`,
+  "",
+].join("\r\n");
+
+// =============================================================================
+// Request Encoding
+// =============================================================================
+
+describe("buildBatchBody", () => {
+  it("encodes each part as application/http with a numbered Content-ID", () => {
+    const body = buildBatchBody(
+      [
+        { method: "POST", path: "/calendar/v3/calendars/primary/events", body: { summary: "Standup" } },
+        { method: "DELETE", path: "/calendar/v3/calendars/primary/events/evt123" },
+      ],
+      "batch_test"
+    );
+
+    expect(body.toString()).toBe(
+      "--batch_test\r\n" +
+        "Content-Type: application/http\r\n" +
+        "Content-ID: <item0>\r\n" +
+        "\r\n" +
+        "POST /calendar/v3/calendars/primary/events HTTP/1.1\r\n" +
+        "Content-Type: application/json\r\n" +
+        "\r\n" +
+        '{"summary":"Standup"}\r\n' +
+        "--batch_test\r\n" +
+        "Content-Type: application/http\r\n" +
+        "Content-ID: <item1>\r\n" +
+        "\r\n" +
+        "DELETE /calendar/v3/calendars/primary/events/evt123 HTTP/1.1\r\n" +
+        "\r\n" +
+        "--batch_test--\r\n"
+    );
+  });
+
+  it("encodes non-ASCII JSON bodies as UTF-8", () => {
+    const body = buildBatchBody([{ method: "POST", path: "/x", body: { summary: "Café ☕" } }], "b");
+    expect(body.toString("utf-8")).toContain('{"summary":"Café ☕"}');
+  });
+});
+
+// =============================================================================
+// Response Parsing
+// =============================================================================
+
+describe("parseBatchResponse", () => {
+  const results = parseBatchResponse(capturedResponse, RESPONSE_CONTENT_TYPE, 4);
+
+  it("maps parts back to request order by Content-ID", () => {
+    expect(results).toHaveLength(4);
+    expect(results[0].status).toBe(200);
+    expect(results[1].status).toBe(204);
+  });
+
+  it("parses a 2xx JSON body", () => {
+    expect(results[0].body).toEqual({ kind: "calendar#event", id: "evt123", summary: "Standup" });
+  });
+
+  it("returns a null body for 204 No Content", () => {
+    expect(results[1].body).toBeNull();
+  });
+
+  it("keeps error parts with their status and error body", () => {
+    expect(results[2]).toEqual({ status: 404, body: { error: { code: 404, message: "Not Found" } } });
+  });
+
+  it("reports items missing from the response", () => {
+    expect(results[3].status).toBe(0);
+    expect(results[3].body.error.message).toBe("No response for batch item");
+  });
+
+  it("ignores Content-IDs outside the request range", () => {
+    const stray = capturedResponse.replace("<response-item2>", "<response-item7>");
+    const parsed = parseBatchResponse(stray, RESPONSE_CONTENT_TYPE, 3);
+    expect(parsed).toHaveLength(3);
+    expect(parsed[2].status).toBe(0);
+  });
+
+  it("accepts a quoted boundary", () => {
+    const quoted = parseBatchResponse(capturedResponse, `multipart/mixed; boundary="${RESPONSE_BOUNDARY}"`, 4);
+    expect(quoted).toEqual(results);
+  });
+
+  it("throws when the content type has no boundary", () => {
+    expect(() => parseBatchResponse(capturedResponse, "multipart/mixed", 4)).toThrow(/boundary/);
+  });
+});
+
+// =============================================================================
+// Chunked Sending
+// =============================================================================
+
+// A successful batch response with one 200 part per item
+function okResponse(count: number): Response {
+  const parts = Array.from({ length: count }, (_, i) =>
+    [
+      `--${RESPONSE_BOUNDARY}`,
+      "Content-Type: application/http",
+      `Content-ID: <response-item${i}>`,
+      "",
+      "HTTP/1.1 200 OK",
+      "Content-Type: application/json; charset=UTF-8",
+      "",
+      JSON.stringify({ id: `evt${i}` }),
+      "",
+    ].join("\r\n")
+  );
+  return new Response(parts.join("") + `--${RESPONSE_BOUNDARY}--\r\n`, {
+    status: 200,
+    headers: { "Content-Type": RESPONSE_CONTENT_TYPE },
+  });
+}
+
+describe("batchRequest", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  const parts = Array.from({ length: BATCH_LIMIT + 2 }, (_, i) => ({
+    method: "POST",
+    path: "/calendar/v3/calendars/primary/events",
+    body: { summary: `Event ${i}` },
+  }));
+
+  it("keeps earlier chunks' results when a later chunk fails", async () => {
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(okResponse(BATCH_LIMIT))
+      .mockResolvedValueOnce(new Response("Rate Limit Exceeded", { status: 429 }));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const results = await batchRequest("token", "calendar/v3", parts);
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(results).toHaveLength(parts.length);
+    expect(results[0]).toEqual({ status: 200, body: { id: "evt0" } });
+    expect(results[BATCH_LIMIT - 1]).toEqual({ status: 200, body: { id: `evt${BATCH_LIMIT - 1}` } });
+    for (const r of results.slice(BATCH_LIMIT)) {
+      expect(r.status).toBe(429);
+      expect(r.body.error.message).toContain("Rate Limit Exceeded");
+    }
+  });
+
+  it("reports a network failure per item", async () => {
+    vi.stubGlobal("fetch", vi.fn().mockRejectedValue(new Error("socket hang up")));
+
+    const results = await batchRequest("token", "calendar/v3", parts.slice(0, 2));
+
+    expect(results).toHaveLength(2);
+    expect(results[1]).toEqual({ status: 0, body: { error: { code: 0, message: "Batch request failed: socket hang up" } } });
+  });
+});
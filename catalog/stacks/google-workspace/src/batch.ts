@@ -0,0 +1,129 @@
+/**
+ * Google API batch wire format
+ *
+ * Encodes sub-requests as a multipart/mixed body, sends them in chunks and
+ * maps the multipart response back to request order by Content-ID. Takes a
+ * bearer token rather than an auth client so it can be tested on its own.
+ */
+
+import { randomBytes } from "crypto";
+
+// Google batch endpoints accept at most 50 sub-requests per call
+export const BATCH_LIMIT = 50;
+
+const CRLF = Buffer.from("\r\n");
+const BATCH_PART_HEADER = Buffer.from("Content-Type: application/http\r\n");
+const BATCH_JSON_HEADER = Buffer.from("Content-Type: application/json\r\n\r\n");
+
+export interface BatchPart {
+  method: string;
+  path: string;
+  body?: unknown;
+}
+
+export interface BatchResult {
+  status: number;
+  body: any;
+}
+
+// Encode up to BATCH_LIMIT sub-requests; part i is sent as Content-ID <item{i}>
+export function buildBatchBody(parts: BatchPart[], boundary: string): Buffer {
+  const delimiter = Buffer.from(`--${boundary}\r\n`);
+
+  // Accumulate byte chunks and concatenate once, rather than building
+  // intermediate strings per sub-request and encoding the result again
+  const buffers: Buffer[] = [];
+  parts.forEach((part, i) => {
+    buffers.push(
+      delimiter,
+      BATCH_PART_HEADER,
+      Buffer.from(`Content-ID: <item${i}>\r\n\r\n${part.method} ${part.path} HTTP/1.1\r\n`)
+    );
+    if (part.body !== undefined) {
+      buffers.push(BATCH_JSON_HEADER, Buffer.from(JSON.stringify(part.body)), CRLF);
+    } else {
+      buffers.push(CRLF);
+    }
+  });
+  buffers.push(Buffer.from(`--${boundary}--\r\n`));
+  return Buffer.concat(buffers);
+}
+
+// Split a multipart/mixed batch response back into per-request results, in request order
+export function parseBatchResponse(text: string, contentType: string | null, count: number): BatchResult[] {
+  const boundary = contentType?.match(/boundary=("?)([^";]+)\1/)?.[2];
+  if (!boundary) {
+    throw new Error("Batch response is missing its multipart boundary");
+  }
+
+  const results: BatchResult[] = Array.from({ length: count }, () => ({
+    status: 0,
+    body: { error: { message: "No response for batch item" } },
+  }));
+
+  for (const part of text.split(`--${boundary}`)) {
+    const id = part.match(/Content-ID:\s*<response-item(\d+)>/i)?.[1];
+    const statusLine = /HTTP\/[\d.]+ (\d{3})/.exec(part);
+    if (id === undefined || !statusLine) continue;
+
+    const http = part.slice(statusLine.index);
+    const separator = /\r?\n\r?\n/.exec(http);
+    const raw = separator ? http.slice(separator.index + separator[0].length).trim() : "";
+    let body: any = null;
+    if (raw) {
+      try {
+        body = JSON.parse(raw);
+      } catch {
+        body = raw;
+      }
+    }
+    // Ignore ids that don't belong to this request rather than growing the array
+    const index = Number(id);
+    if (index >= count) continue;
+    results[index] = { status: Number(statusLine[1]), body };
+  }
+
+  return results;
+}
+
+// One error result per item of a chunk that failed as a whole
+function failedChunk(count: number, status: number, message: string): BatchResult[] {
+  return Array.from({ length: count }, () => ({ status, body: { error: { code: status, message } } }));
+}
+
+// Send many API calls as multipart/mixed batches (one HTTP round-trip per BATCH_LIMIT calls).
+// Always returns one result per part, in order: earlier chunks may already have taken
+// effect, so a failed chunk is reported per item instead of discarding their results.
+export async function batchRequest(
+  token: string | null | undefined,
+  api: string,
+  parts: BatchPart[]
+): Promise<BatchResult[]> {
+  const results: BatchResult[] = [];
+
+  for (let offset = 0; offset < parts.length; offset += BATCH_LIMIT) {
+    const chunk = parts.slice(offset, offset + BATCH_LIMIT);
+    const boundary = `batch_${randomBytes(8).toString("hex")}`;
+
+    try {
+      const res = await fetch(`https://www.googleapis.com/batch/${api}`, {
+        method: "POST",
+        headers: {
+          Authorization: `Bearer ${token}`,
+          "Content-Type": `multipart/mixed; boundary=${boundary}`,
+        },
+        body: buildBatchBody(chunk, boundary),
+      });
+      const text = await res.text();
+      if (!res.ok) {
+        results.push(...failedChunk(chunk.length, res.status, `Batch request failed (${res.status}): ${text}`));
+        continue;
+      }
+      results.push(...parseBatchResponse(text, res.headers.get("content-type"), chunk.length));
+    } catch (e: any) {
+      results.push(...failedChunk(chunk.length, 0, `Batch request failed: ${e.message}`));
+    }
+  }
+
+  return results;
+}
@@ -13,13 +13,17 @@ import {
 import { google } from "googleapis";
 import { config } from "dotenv";
 import { fileURLToPath } from "url";
-import { dirname, join } from "path";
-import { readFileSync, writeFileSync, existsSync, mkdirSync, readdirSync, unlinkSync } from "fs";
-import { execSync } from "child_process";
+import { dirname, join, basename } from "path";
+import { readFileSync, writeFileSync, existsSync, mkdirSync, readdirSync, unlinkSync, statSync, createReadStream } from "fs";
+import { readFile, writeFile, mkdtemp, rm } from "fs/promises";
+import { execFile } from "child_process";
+import { promisify } from "util";
 import { tmpdir } from "os";
 import { homedir } from "os";
+import { batchRequest as sendBatch, type BatchPart, type BatchResult } from "./batch.js";
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
+const execFileAsync = promisify(execFile);
 
 // Default output: ~/.rudi/output/
 const DEFAULT_OUTPUT_DIR = join(homedir(), ".rudi", "output");
@@ -70,25 +74,31 @@ function getAvailableAccounts(): string[] {
   });
 }
 
-function loadToken(account?: string) {
-  let tokenPath = TOKEN_FILE;
+function getTokenPath(account?: string): string {
   if (account) {
-    tokenPath = join(ACCOUNTS_DIR, account, "token.json");
+    return join(ACCOUNTS_DIR, account, "token.json");
   } else if (currentAccount) {
-    tokenPath = join(ACCOUNTS_DIR, currentAccount, "token.json");
+    return join(ACCOUNTS_DIR, currentAccount, "token.json");
   }
-  if (existsSync(tokenPath)) {
-    return JSON.parse(readFileSync(tokenPath, "utf-8"));
-  }
-  return null;
+  return TOKEN_FILE;
 }
 
+// One OAuth client per token file, so every tool call shares the parsed token
+// and any access token refreshed in memory. Re-read if the file changes (re-auth).
+let cachedAuth: { tokenPath: string; mtimeMs: number; client: InstanceType<typeof google.auth.OAuth2> } | null = null;
+
 function getAuth() {
-  const token = loadToken();
-  if (!token) {
+  const tokenPath = getTokenPath();
+  if (!existsSync(tokenPath)) {
     throw new Error("Not authenticated. Run 'npm run auth' first.");
   }
 
+  const { mtimeMs } = statSync(tokenPath);
+  if (cachedAuth && cachedAuth.tokenPath === tokenPath && cachedAuth.mtimeMs === mtimeMs) {
+    return cachedAuth.client;
+  }
+
+  const token = JSON.parse(readFileSync(tokenPath, "utf-8"));
   const oauth2Client = new google.auth.OAuth2(
     token.client_id,
     token.client_secret
@@ -98,9 +108,67 @@ function getAuth() {
     refresh_token: token.refresh_token,
     expiry_date: token.expiry ? new Date(token.expiry).getTime() : undefined,
   });
+  cachedAuth = { tokenPath, mtimeMs, client: oauth2Client };
   return oauth2Client;
 }
 
+// Send many API calls through the batch endpoint; one result per part, in order
+async function batchRequest(
+  auth: ReturnType<typeof getAuth>,
+  api: string,
+  parts: BatchPart[]
+): Promise<BatchResult[]> {
+  const { token } = await auth.getAccessToken();
+  return sendBatch(token, api, parts);
+}
+
+// Run fn over items with at most `limit` requests in flight, preserving order
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
+    }
+  });
+  await Promise.all(workers);
+  return results;
+}
+
+// Index message headers once (first occurrence wins) instead of scanning per field
+function headerMap(headers?: { name?: string | null; value?: string | null }[] | null): Map<string, string> {
+  const map = new Map<string, string>();
+  for (const h of headers || []) {
+    if (h.name && !map.has(h.name)) map.set(h.name, h.value || "");
+  }
+  return map;
+}
+
+const TEXT_ATTACHMENT_EXTENSIONS = new Set(["txt", "md", "csv", "json", "xml", "html", "htm"]);
+
+// Partial responses: only request the fields the tools actually return
+const SEARCH_HEADERS = ["Subject", "From", "Date"];
+const CALENDAR_LIST_FIELDS = "items(id,summary,start,end,location)";
+
+// Keep concurrent Gmail reads under the per-user concurrent request limit
+const GMAIL_CONCURRENCY = 8;
+
+function toDraftRequest(d: { to: string; subject: string; body: string }) {
+  const message = [`To: ${d.to}`, `Subject: ${d.subject}`, "", d.body].join("\n");
+  return { message: { raw: Buffer.from(message).toString("base64url") } };
+}
+
+function toCalendarEvent(e: { summary: string; start: string; end: string; description?: string; location?: string }) {
+  return {
+    summary: e.summary,
+    start: { dateTime: e.start },
+    end: { dateTime: e.end },
+    description: e.description,
+    location: e.location,
+  };
+}
+
 const server = new Server(
   { name: "google-workspace", version: "1.0.0" },
   { capabilities: { tools: {} } }
@@ -170,6 +238,20 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
         required: ["to", "subject", "body"],
       },
     },
+    {
+      name: "gmail_draft_batch",
+      description: "Create multiple email drafts in a single batch request",
+      inputSchema: {
+        type: "object",
+        properties: {
+          drafts: {
+            type: "array",
+            description: "Drafts to create: [{ to, subject, body }]",
+          },
+        },
+        required: ["drafts"],
+      },
+    },
     {
       name: "gmail_get",
       description: "Get full email content by message ID (includes body text)",
@@ -396,6 +478,20 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
         required: ["summary", "start", "end"],
       },
     },
+    {
+      name: "calendar_create_batch",
+      description: "Create multiple calendar events in a single batch request",
+      inputSchema: {
+        type: "object",
+        properties: {
+          events: {
+            type: "array",
+            description: "Events to create: [{ summary, start, end, description?, location? }] (ISO datetimes)",
+          },
+        },
+        required: ["events"],
+      },
+    },
     {
       name: "calendar_quick_add",
       description: "Create event using natural language",
@@ -418,6 +514,17 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
         required: ["event_id"],
       },
     },
+    {
+      name: "calendar_delete_batch",
+      description: "Delete multiple calendar events in a single batch request",
+      inputSchema: {
+        type: "object",
+        properties: {
+          event_ids: { type: "array", description: "Event IDs to delete" },
+        },
+        required: ["event_ids"],
+      },
+    },
   ],
 }));
 
@@ -488,17 +595,24 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           q: args?.query as string,
           maxResults: (args?.max_results as number) || 10,
         });
-        const messages = await Promise.all(
-          (res.data.messages || []).map(async (m) => {
-            const msg = await gmail.users.messages.get({ userId: "me", id: m.id! });
-            const headers = msg.data.payload?.headers || [];
+        const messages = await mapWithConcurrency(
+          res.data.messages || [],
+          GMAIL_CONCURRENCY,
+          async (m) => {
+            const msg = await gmail.users.messages.get({
+              userId: "me",
+              id: m.id!,
+              format: "metadata",
+              metadataHeaders: SEARCH_HEADERS,
+            });
+            const headers = headerMap(msg.data.payload?.headers);
             return {
               id: m.id,
-              subject: headers.find((h) => h.name === "Subject")?.value,
-              from: headers.find((h) => h.name === "From")?.value,
-              date: headers.find((h) => h.name === "Date")?.value,
+              subject: headers.get("Subject"),
+              from: headers.get("From"),
+              date: headers.get("Date"),
             };
-          })
+          }
         );
         const text = JSON.stringify(messages, null, 2);
         if (args?.output) {
@@ -526,6 +640,32 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         return { content: [{ type: "text", text: `Draft created: ${draft.data.id}` }] };
       }
 
+      case "gmail_draft_batch": {
+        const auth = getAuth();
+        const drafts = (args?.drafts as any[]) || [];
+        const results = await batchRequest(
+          auth,
+          "gmail/v1",
+          drafts.map((d) => ({
+            method: "POST",
+            path: "/gmail/v1/users/me/drafts",
+            body: toDraftRequest(d),
+          }))
+        );
+        // Failed chunks come back as per-item errors, so results[i] always matches drafts[i]
+        const created = drafts.map((d, i) => results[i].status >= 200 && results[i].status < 300
+          ? { to: d.to, id: results[i].body?.id }
+          : { to: d.to, error: results[i].body?.error?.message || `HTTP ${results[i].status}` });
+        const failed = created.filter((c) => "error" in c).length;
+        return {
+          content: [{
+            type: "text",
+            text: `Created ${created.length - failed}/${created.length} drafts\n${JSON.stringify(created, null, 2)}`,
+          }],
+          isError: failed === created.length && created.length > 0,
+        };
+      }
+
       case "gmail_get": {
         const auth = getAuth();
         const gmail = google.gmail({ version: "v1", auth });
@@ -535,11 +675,11 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           id: messageId,
           format: "full",
         });
-        const headers = msg.data.payload?.headers || [];
-        const subject = headers.find((h) => h.name === "Subject")?.value || "";
-        const from = headers.find((h) => h.name === "From")?.value || "";
-        const to = headers.find((h) => h.name === "To")?.value || "";
-        const date = headers.find((h) => h.name === "Date")?.value || "";
+        const headers = headerMap(msg.data.payload?.headers);
+        const subject = headers.get("Subject") || "";
+        const from = headers.get("From") || "";
+        const to = headers.get("To") || "";
+        const date = headers.get("Date") || "";
 
         // Extract body from payload
         function extractBody(payload: any): { text: string; html: string } {
@@ -645,17 +785,18 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
         // Handle document files - extract text
         if (ext === "docx") {
-          const tempPath = join(tmpdir(), `gmail-attachment-${Date.now()}.docx`);
-          const tempDir = join(tmpdir(), `gmail-doc-${Date.now()}`);
-          writeFileSync(tempPath, data);
+          // Private temp dir per call so concurrent extractions never collide
+          const tempDir = await mkdtemp(join(tmpdir(), "gmail-doc-"));
+          const tempPath = join(tempDir, "attachment.docx");
+          const extractDir = join(tempDir, "extracted");
           try {
-            execSync(`unzip -o "${tempPath}" -d "${tempDir}"`, { stdio: "pipe" });
-            const xmlPath = join(tempDir, "word", "document.xml");
+            await writeFile(tempPath, data);
+            // Async so a large archive doesn't stall other in-flight tool calls
+            await execFileAsync("unzip", ["-o", tempPath, "-d", extractDir]);
+            const xmlPath = join(extractDir, "word", "document.xml");
             if (existsSync(xmlPath)) {
-              const xml = readFileSync(xmlPath, "utf-8");
+              const xml = await readFile(xmlPath, "utf-8");
               const text = xml.replace(/<[^>]*>/g, " ").replace(/\s+/g, " ").trim();
-              // Cleanup
-              execSync(`rm -rf "${tempDir}" "${tempPath}"`, { stdio: "pipe" });
               if (outputPath) {
                 writeFileSync(outputPath, text, "utf-8");
                 return { content: [{ type: "text", text: `Extracted text saved to ${outputPath}` }] };
@@ -664,11 +805,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
             }
           } catch (e: any) {
             return { content: [{ type: "text", text: `Error extracting docx: ${e.message}` }], isError: true };
+          } finally {
+            await rm(tempDir, { recursive: true, force: true });
           }
         }
 
         // Handle text files
-        if (["txt", "md", "csv", "json", "xml", "html", "htm"].includes(ext || "")) {
+        if (TEXT_ATTACHMENT_EXTENSIONS.has(ext || "")) {
           const text = data.toString("utf-8");
           if (outputPath) {
             writeFileSync(outputPath, text, "utf-8");
@@ -709,13 +852,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           format: "full",
         });
 
-        const headers = original.data.payload?.headers || [];
-        const subject = headers.find((h) => h.name === "Subject")?.value || "";
-        const from = headers.find((h) => h.name === "From")?.value || "";
-        const to = headers.find((h) => h.name === "To")?.value || "";
-        const cc = headers.find((h) => h.name === "Cc")?.value || "";
-        const messageIdHeader = headers.find((h) => h.name === "Message-ID")?.value || "";
-        const references = headers.find((h) => h.name === "References")?.value || "";
+        const headers = headerMap(original.data.payload?.headers);
+        const subject = headers.get("Subject") || "";
+        const from = headers.get("From") || "";
+        const to = headers.get("To") || "";
+        const cc = headers.get("Cc") || "";
+        const messageIdHeader = headers.get("Message-ID") || "";
+        const references = headers.get("References") || "";
 
         // Build recipient list
         let recipients = from; // Reply to sender
@@ -794,13 +937,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         }
 
         const messages = (thread.data.messages || []).map((msg) => {
-          const headers = msg.payload?.headers || [];
+          const headers = headerMap(msg.payload?.headers);
           return {
             id: msg.id,
-            from: headers.find((h) => h.name === "From")?.value,
-            to: headers.find((h) => h.name === "To")?.value,
-            date: headers.find((h) => h.name === "Date")?.value,
-            subject: headers.find((h) => h.name === "Subject")?.value,
+            from: headers.get("From"),
+            to: headers.get("To"),
+            date: headers.get("Date"),
+            subject: headers.get("Subject"),
             body: extractBody(msg.payload),
           };
         });
@@ -975,17 +1118,15 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       case "drive_upload": {
         const auth = getAuth();
         const drive = google.drive({ version: "v3", auth });
-        const fs = await import("fs");
-        const path = await import("path");
         const filePath = args?.file_path as string;
-        const fileName = (args?.name as string) || path.basename(filePath);
+        const fileName = (args?.name as string) || basename(filePath);
         const res = await drive.files.create({
           requestBody: {
             name: fileName,
             parents: args?.folder_id ? [args.folder_id as string] : undefined,
           },
           media: {
-            body: fs.createReadStream(filePath),
+            body: createReadStream(filePath),
           },
           fields: "id, webViewLink",
         });
@@ -1035,6 +1176,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
           maxResults: (args?.max_results as number) || 20,
           singleEvents: true,
           orderBy: "startTime",
+          fields: CALENDAR_LIST_FIELDS,
         });
         const events = (res.data.items || []).map((e) => ({
           id: e.id,
@@ -1064,6 +1206,31 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         };
       }
 
+      case "calendar_create_batch": {
+        const auth = getAuth();
+        const events = (args?.events as any[]) || [];
+        const results = await batchRequest(
+          auth,
+          "calendar/v3",
+          events.map((e) => ({
+            method: "POST",
+            path: "/calendar/v3/calendars/primary/events",
+            body: toCalendarEvent(e),
+          }))
+        );
+        const created = events.map((e, i) => results[i].status >= 200 && results[i].status < 300
+          ? { summary: e.summary, id: results[i].body?.id, link: results[i].body?.htmlLink }
+          : { summary: e.summary, error: results[i].body?.error?.message || `HTTP ${results[i].status}` });
+        const failed = created.filter((c) => "error" in c).length;
+        return {
+          content: [{
+            type: "text",
+            text: `Created ${created.length - failed}/${created.length} events\n${JSON.stringify(created, null, 2)}`,
+          }],
+          isError: failed === created.length && created.length > 0,
+        };
+      }
+
       case "calendar_quick_add": {
         const auth = getAuth();
         const calendar = google.calendar({ version: "v3", auth });
@@ -1086,6 +1253,32 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         return { content: [{ type: "text", text: "Event deleted successfully" }] };
       }
 
+      case "calendar_delete_batch": {
+        const auth = getAuth();
+        const eventIds = (args?.event_ids as string[]) || [];
+        const results = await batchRequest(
+          auth,
+          "calendar/v3",
+          eventIds.map((id) => ({
+            method: "DELETE",
+            path: `/calendar/v3/calendars/primary/events/${encodeURIComponent(id)}`,
+          }))
+        );
+        const failed = eventIds
+          .map((id, i) => ({ id, status: results[i].status, error: results[i].body?.error?.message }))
+          .filter((r) => r.status < 200 || r.status >= 300);
+        const deleted = eventIds.length - failed.length;
+        return {
+          content: [{
+            type: "text",
+            text: failed.length === 0
+              ? `Deleted ${deleted} events`
+              : `Deleted ${deleted}/${eventIds.length} events\nFailed:\n${JSON.stringify(failed, null, 2)}`,
+          }],
+          isError: failed.length === eventIds.length && eventIds.length > 0,
+        };
+      }
+
       default:
         return { content: [{ type: "text", text: `Unknown tool: ${name}` }], isError: true };
     }
@@ -1123,17 +1316,24 @@ export async function gmailSearch(options: { query: string; max_results?: number
     q: options.query,
     maxResults: options.max_results || 10,
   });
-  const messages = await Promise.all(
-    (res.data.messages || []).map(async (m) => {
-      const msg = await gmail.users.messages.get({ userId: "me", id: m.id! });
-      const headers = msg.data.payload?.headers || [];
+  const messages = await mapWithConcurrency(
+    res.data.messages || [],
+    GMAIL_CONCURRENCY,
+    async (m) => {
+      const msg = await gmail.users.messages.get({
+        userId: "me",
+        id: m.id!,
+        format: "metadata",
+        metadataHeaders: SEARCH_HEADERS,
+      });
+      const headers = headerMap(msg.data.payload?.headers);
       return {
         id: m.id,
-        subject: headers.find((h) => h.name === "Subject")?.value,
-        from: headers.find((h) => h.name === "From")?.value,
-        date: headers.find((h) => h.name === "Date")?.value,
+        subject: headers.get("Subject"),
+        from: headers.get("From"),
+        date: headers.get("Date"),
       };
-    })
+    }
   );
   if (options.output) {
     writeFileSync(options.output, JSON.stringify(messages, null, 2), "utf-8");
@@ -1141,6 +1341,22 @@ export async function gmailSearch(options: { query: string; max_results?: number
   return { messages, filePath: options.output };
 }
 
+export async function gmailDraftBatch(options: { drafts: Array<{ to: string; subject: string; body: string }> }) {
+  const auth = getAuth();
+  const results = await batchRequest(
+    auth,
+    "gmail/v1",
+    options.drafts.map((d) => ({
+      method: "POST",
+      path: "/gmail/v1/users/me/drafts",
+      body: toDraftRequest(d),
+    }))
+  );
+  return options.drafts.map((d, i) => results[i].status >= 200 && results[i].status < 300
+    ? { to: d.to, draftId: results[i].body?.id as string }
+    : { to: d.to, error: (results[i].body?.error?.message as string) || `HTTP ${results[i].status}` });
+}
+
 export async function docsRead(options: { document_id: string; output?: string }) {
   const auth = getAuth();
   const docs = google.docs({ version: "v1", auth });
@@ -1198,12 +1414,10 @@ export async function sheetsWrite(options: { spreadsheet_id: string; range: stri
 export async function driveUpload(options: { file_path: string; name?: string; folder_id?: string }) {
   const auth = getAuth();
   const drive = google.drive({ version: "v3", auth });
-  const fs = await import("fs");
-  const path = await import("path");
-  const fileName = options.name || path.basename(options.file_path);
+  const fileName = options.name || basename(options.file_path);
   const res = await drive.files.create({
     requestBody: { name: fileName, parents: options.folder_id ? [options.folder_id] : undefined },
-    media: { body: fs.createReadStream(options.file_path) },
+    media: { body: createReadStream(options.file_path) },
     fields: "id, webViewLink",
   });
   return { fileId: res.data.id, url: res.data.webViewLink };
@@ -1222,6 +1436,7 @@ export async function calendarList(options?: { days?: number; max_results?: numb
     maxResults: options?.max_results || 20,
     singleEvents: true,
     orderBy: "startTime",
+    fields: CALENDAR_LIST_FIELDS,
   });
   return (res.data.items || []).map((e) => ({
     id: e.id,
@@ -1248,6 +1463,41 @@ export async function calendarCreate(options: { summary: string; start: string;
   return { eventId: event.data.id, url: event.data.htmlLink };
 }
 
+export async function calendarCreateBatch(options: {
+  events: Array<{ summary: string; start: string; end: string; description?: string; location?: string }>;
+}) {
+  const auth = getAuth();
+  const results = await batchRequest(
+    auth,
+    "calendar/v3",
+    options.events.map((e) => ({
+      method: "POST",
+      path: "/calendar/v3/calendars/primary/events",
+      body: toCalendarEvent(e),
+    }))
+  );
+  return options.events.map((_, i) => results[i].status >= 200 && results[i].status < 300
+    ? { eventId: results[i].body?.id as string, url: results[i].body?.htmlLink as string }
+    : { error: (results[i].body?.error?.message as string) || `HTTP ${results[i].status}` });
+}
+
+export async function calendarDeleteBatch(options: { event_ids: string[] }) {
+  const auth = getAuth();
+  const results = await batchRequest(
+    auth,
+    "calendar/v3",
+    options.event_ids.map((id) => ({
+      method: "DELETE",
+      path: `/calendar/v3/calendars/primary/events/${encodeURIComponent(id)}`,
+    }))
+  );
+  return options.event_ids.map((eventId, i) => ({
+    eventId,
+    deleted: results[i].status >= 200 && results[i].status < 300,
+    error: results[i].body?.error?.message as string | undefined,
+  }));
+}
+
 // Only start MCP when run directly
 const isMainModule = process.argv[1]?.includes("google-workspace");
 if (isMainModule && !process.argv.includes("--no-mcp")) {
@@ -13,7 +13,8 @@ import { Server } from "@modelcontextprotocol/sdk/server/index.js";
 import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
 import { CallToolRequestSchema, ListToolsRequestSchema } from "@modelcontextprotocol/sdk/types.js";
 import OpenAI from "openai";
-import { writeFileSync, readFileSync, existsSync, mkdirSync, statSync } from "fs";
+import { writeFileSync, readFileSync, existsSync, mkdirSync, statSync, createWriteStream } from "fs";
+import { pipeline } from "stream/promises";
 import { config } from "dotenv";
 import { fileURLToPath } from "url";
 import { dirname, join, basename } from "path";
@@ -33,10 +34,16 @@ function expandPath(p: string): string {
   return p;
 }
 
+// Reuse one client (and its keep-alive connections) across tool calls
+let openaiClient: OpenAI | null = null;
+
 function getClient(): OpenAI {
-  const apiKey = process.env.OPENAI_API_KEY;
-  if (!apiKey) throw new Error("OPENAI_API_KEY not configured");
-  return new OpenAI({ apiKey });
+  if (!openaiClient) {
+    const apiKey = process.env.OPENAI_API_KEY;
+    if (!apiKey) throw new Error("OPENAI_API_KEY not configured");
+    openaiClient = new OpenAI({ apiKey });
+  }
+  return openaiClient;
 }
 
 function generateFilename(prefix: string, ext: string): string {
@@ -248,7 +255,6 @@ export async function textToSpeech(
   if (options.speed) params.speed = options.speed;
 
   const response = await client.audio.speech.create(params);
-  const buffer = Buffer.from(await response.arrayBuffer());
 
   ensureOutputDir();
   const outputPath = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
@@ -258,7 +264,8 @@ export async function textToSpeech(
       ? join(outputPath, generateFilename("speech", responseFormat))
       : join(DEFAULT_OUTPUT_DIR, generateFilename("speech", responseFormat));
 
-  writeFileSync(finalPath, buffer);
+  // Write audio chunks as they arrive instead of buffering the whole file
+  await pipeline(response.body as any, createWriteStream(finalPath));
 
   return {
     localPath: finalPath,
@@ -326,8 +333,10 @@ export async function generateVideo(
         : join(DEFAULT_OUTPUT_DIR, generateFilename("sora", "mp4"));
 
     const videoResponse = await fetch(response.url);
-    const buffer = Buffer.from(await videoResponse.arrayBuffer());
-    writeFileSync(finalPath, buffer);
+    if (!videoResponse.ok || !videoResponse.body) {
+      throw new Error(`Video download failed: ${videoResponse.status}`);
+    }
+    await pipeline(videoResponse.body as any, createWriteStream(finalPath));
     result.localPath = finalPath;
   }
 
@@ -24,13 +24,19 @@ import { homedir } from "os";
 // CORE API - The actual functionality
 // =============================================================================
 
-// Initialize Slack client (lazy - will fail if token not set when used)
+// Initialize Slack client (lazy - will fail if token not set when used).
+// One client per process so calls share its keep-alive connections.
+let slackClient: WebClient | null = null;
+
 function getClient(): WebClient {
-  const token = process.env.SLACK_BOT_TOKEN;
-  if (!token) {
-    throw new Error("SLACK_BOT_TOKEN environment variable not set");
+  if (!slackClient) {
+    const token = process.env.SLACK_BOT_TOKEN;
+    if (!token) {
+      throw new Error("SLACK_BOT_TOKEN environment variable not set");
+    }
+    slackClient = new WebClient(token);
   }
-  return new WebClient(token);
+  return slackClient;
 }
 
 // Default channel (can be overridden per call)
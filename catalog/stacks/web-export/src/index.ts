@@ -13,7 +13,6 @@ import { Server } from "@modelcontextprotocol/sdk/server/index.js";
 import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
 import { CallToolRequestSchema, ListToolsRequestSchema } from "@modelcontextprotocol/sdk/types.js";
 import { chromium, Browser, Page } from "playwright";
-import { PDFDocument } from "pdf-lib";
 import { writeFileSync, readFileSync, existsSync, mkdirSync, statSync } from "fs";
 import { config } from "dotenv";
 import { fileURLToPath } from "url";
@@ -50,6 +49,38 @@ const ARTBOARD_SIZES = {
 
 type ArtboardSize = keyof typeof ARTBOARD_SIZES;
 
+// =============================================================================
+// BROWSER
+// =============================================================================
+
+// MCP mode keeps one Chromium for the life of the server and gives each export
+// its own isolated context. API and CLI calls launch their own browser and close
+// it when done, so importers never inherit a running Chromium.
+let shareBrowser = false;
+let browserPromise: Promise<Browser> | null = null;
+
+function getBrowser(): Promise<Browser> {
+  if (!shareBrowser) return chromium.launch();
+  if (!browserPromise) {
+    const launched = chromium.launch().then((browser) => {
+      browser.on("disconnected", () => {
+        // A newer browser may already have replaced this one
+        if (browserPromise === launched) browserPromise = null;
+      });
+      return browser;
+    });
+    launched.catch(() => {
+      if (browserPromise === launched) browserPromise = null;
+    });
+    browserPromise = launched;
+  }
+  return browserPromise;
+}
+
+async function releaseBrowser(browser: Browser): Promise<void> {
+  if (!shareBrowser) await browser.close();
+}
+
 // =============================================================================
 // HTML TO PNG
 // =============================================================================
@@ -82,59 +113,62 @@ export async function htmlToPng(
   const viewportWidth = Math.round(size.width * dpi);
   const viewportHeight = Math.round(size.height * dpi);
 
-  const browser = await chromium.launch();
+  const browser = await getBrowser();
   const context = await browser.newContext({
     viewport: { width: viewportWidth, height: viewportHeight },
     deviceScaleFactor: scale,
   });
-  const page = await context.newPage();
-
-  const fileUrl = `file://${resolve(expandedPath)}`;
-  await page.goto(fileUrl);
-  await page.waitForLoadState("networkidle");
-  await page.waitForTimeout(1000); // Wait for fonts
-
-  ensureOutputDir();
-  const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
-  const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
-    ? outputDir
-    : dirname(outputDir);
-  ensureOutputDir(outputPath);
-
-  const baseName = basename(expandedPath, ".html");
-  const results: string[] = [];
-
-  // Check for multiple artboards
-  const artboards = await page.$$(".artboard");
-
-  if (artboards.length > 1 || options.paginated) {
-    // Paginated - capture each artboard
-    for (let i = 0; i < artboards.length; i++) {
-      const artboard = artboards[i];
-      await artboard.scrollIntoViewIfNeeded();
-      await page.waitForTimeout(200);
-
-      const pngPath = join(outputPath, `${baseName}-page-${String(i + 1).padStart(2, "0")}.png`);
-      await artboard.screenshot({ path: pngPath });
+  try {
+    const page = await context.newPage();
+
+    const fileUrl = `file://${resolve(expandedPath)}`;
+    await page.goto(fileUrl);
+    await page.waitForLoadState("networkidle");
+    await page.waitForTimeout(1000); // Wait for fonts
+
+    ensureOutputDir();
+    const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
+    const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
+      ? outputDir
+      : dirname(outputDir);
+    ensureOutputDir(outputPath);
+
+    const baseName = basename(expandedPath, ".html");
+    const results: string[] = [];
+
+    // Check for multiple artboards
+    const artboards = await page.$$(".artboard");
+
+    if (artboards.length > 1 || options.paginated) {
+      // Paginated - capture each artboard
+      for (let i = 0; i < artboards.length; i++) {
+        const artboard = artboards[i];
+        await artboard.scrollIntoViewIfNeeded();
+        await page.waitForTimeout(200);
+
+        const pngPath = join(outputPath, `${baseName}-page-${String(i + 1).padStart(2, "0")}.png`);
+        await artboard.screenshot({ path: pngPath });
+        results.push(pngPath);
+      }
+    } else {
+      // Single page
+      const pngPath = options.output && !statSync(options.output).isDirectory()
+        ? expandPath(options.output)
+        : join(outputPath, `${baseName}.png`);
+      await page.screenshot({ path: pngPath, fullPage: true });
       results.push(pngPath);
     }
-  } else {
-    // Single page
-    const pngPath = options.output && !statSync(options.output).isDirectory()
-      ? expandPath(options.output)
-      : join(outputPath, `${baseName}.png`);
-    await page.screenshot({ path: pngPath, fullPage: true });
-    results.push(pngPath);
-  }
 
-  await browser.close();
-
-  return {
-    localPath: results.length === 1 ? results[0] : outputPath,
-    width: viewportWidth * scale,
-    height: viewportHeight * scale,
-    pages: results.length,
-  };
+    return {
+      localPath: results.length === 1 ? results[0] : outputPath,
+      width: viewportWidth * scale,
+      height: viewportHeight * scale,
+      pages: results.length,
+    };
+  } finally {
+    await context.close();
+    await releaseBrowser(browser);
+  }
 }
 
 // =============================================================================
@@ -163,65 +197,68 @@ export async function htmlToPdf(
 
   const size = ARTBOARD_SIZES[options.artboardSize || "letter"];
 
-  const browser = await chromium.launch();
+  const browser = await getBrowser();
   const context = await browser.newContext();
-  const page = await context.newPage();
-
-  const fileUrl = `file://${resolve(expandedPath)}`;
-  await page.goto(fileUrl);
-  await page.waitForLoadState("networkidle");
-  await page.waitForTimeout(1000);
-
-  ensureOutputDir();
-  const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
-  const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
-    ? outputDir
-    : dirname(outputDir);
-  ensureOutputDir(outputPath);
-
-  const baseName = basename(expandedPath, ".html");
-
-  // Check for multiple artboards
-  const artboards = await page.$$(".artboard");
-  const pageCount = artboards.length || 1;
-
-  // Prepare page for clean PDF export
-  await page.evaluate(() => {
-    const container = document.querySelector(".artboards-container") as HTMLElement;
-    if (container) {
-      container.style.padding = "0";
-      container.style.gap = "0";
-      container.style.background = "white";
-    }
-    const boards = document.querySelectorAll(".artboard") as NodeListOf<HTMLElement>;
-    boards.forEach((board) => {
-      board.style.marginBottom = "0";
-      board.style.boxShadow = "none";
+  try {
+    const page = await context.newPage();
+
+    const fileUrl = `file://${resolve(expandedPath)}`;
+    await page.goto(fileUrl);
+    await page.waitForLoadState("networkidle");
+    await page.waitForTimeout(1000);
+
+    ensureOutputDir();
+    const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
+    const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
+      ? outputDir
+      : dirname(outputDir);
+    ensureOutputDir(outputPath);
+
+    const baseName = basename(expandedPath, ".html");
+
+    // Check for multiple artboards
+    const artboards = await page.$$(".artboard");
+    const pageCount = artboards.length || 1;
+
+    // Prepare page for clean PDF export
+    await page.evaluate(() => {
+      const container = document.querySelector(".artboards-container") as HTMLElement;
+      if (container) {
+        container.style.padding = "0";
+        container.style.gap = "0";
+        container.style.background = "white";
+      }
+      const boards = document.querySelectorAll(".artboard") as NodeListOf<HTMLElement>;
+      boards.forEach((board) => {
+        board.style.marginBottom = "0";
+        board.style.boxShadow = "none";
+      });
+      document.body.style.margin = "0";
+      document.body.style.padding = "0";
     });
-    document.body.style.margin = "0";
-    document.body.style.padding = "0";
-  });
 
-  const pdfPath = options.output && !existsSync(options.output)
-    ? expandPath(options.output)
-    : join(outputPath, pageCount > 1 ? `${baseName}-all-pages.pdf` : `${baseName}.pdf`);
-
-  await page.pdf({
-    path: pdfPath,
-    width: `${size.width}in`,
-    height: `${size.height}in`,
-    printBackground: true,
-    margin: { top: "0", right: "0", bottom: "0", left: "0" },
-    preferCSSPageSize: true,
-  });
-
-  await browser.close();
+    const pdfPath = options.output && !existsSync(options.output)
+      ? expandPath(options.output)
+      : join(outputPath, pageCount > 1 ? `${baseName}-all-pages.pdf` : `${baseName}.pdf`);
+
+    await page.pdf({
+      path: pdfPath,
+      width: `${size.width}in`,
+      height: `${size.height}in`,
+      printBackground: true,
+      margin: { top: "0", right: "0", bottom: "0", left: "0" },
+      preferCSSPageSize: true,
+    });
 
-  return {
-    localPath: pdfPath,
-    pages: pageCount,
-    format: size.name,
-  };
+    return {
+      localPath: pdfPath,
+      pages: pageCount,
+      format: size.name,
+    };
+  } finally {
+    await context.close();
+    await releaseBrowser(browser);
+  }
 }
 
 // =============================================================================
@@ -254,84 +291,87 @@ export async function htmlToPngPdf(
   const viewportWidth = Math.round(size.width * dpi);
   const viewportHeight = Math.round(size.height * dpi);
 
-  const browser = await chromium.launch();
+  const browser = await getBrowser();
   const context = await browser.newContext({
     viewport: { width: viewportWidth, height: viewportHeight },
     deviceScaleFactor: scale,
   });
-  const page = await context.newPage();
-
-  const fileUrl = `file://${resolve(expandedPath)}`;
-  await page.goto(fileUrl);
-  await page.waitForLoadState("networkidle");
-  await page.waitForTimeout(1000);
-
-  ensureOutputDir();
-  const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
-  const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
-    ? outputDir
-    : dirname(outputDir) || DEFAULT_OUTPUT_DIR;
-  ensureOutputDir(outputPath);
-
-  const baseName = basename(expandedPath, ".html");
-  const pngPaths: string[] = [];
-
-  // Check for multiple artboards
-  const artboards = await page.$$(".artboard");
-  const pageCount = artboards.length || 1;
-
-  // Capture PNGs
-  if (artboards.length > 1) {
-    for (let i = 0; i < artboards.length; i++) {
-      const artboard = artboards[i];
-      await artboard.scrollIntoViewIfNeeded();
-      await page.waitForTimeout(200);
-
-      const pngPath = join(outputPath, `${baseName}-page-${String(i + 1).padStart(2, "0")}.png`);
-      await artboard.screenshot({ path: pngPath });
+  try {
+    const page = await context.newPage();
+
+    const fileUrl = `file://${resolve(expandedPath)}`;
+    await page.goto(fileUrl);
+    await page.waitForLoadState("networkidle");
+    await page.waitForTimeout(1000);
+
+    ensureOutputDir();
+    const outputDir = options.output ? expandPath(options.output) : DEFAULT_OUTPUT_DIR;
+    const outputPath = existsSync(outputDir) && statSync(outputDir).isDirectory()
+      ? outputDir
+      : dirname(outputDir) || DEFAULT_OUTPUT_DIR;
+    ensureOutputDir(outputPath);
+
+    const baseName = basename(expandedPath, ".html");
+    const pngPaths: string[] = [];
+
+    // Check for multiple artboards
+    const artboards = await page.$$(".artboard");
+    const pageCount = artboards.length || 1;
+
+    // Capture PNGs
+    if (artboards.length > 1) {
+      for (let i = 0; i < artboards.length; i++) {
+        const artboard = artboards[i];
+        await artboard.scrollIntoViewIfNeeded();
+        await page.waitForTimeout(200);
+
+        const pngPath = join(outputPath, `${baseName}-page-${String(i + 1).padStart(2, "0")}.png`);
+        await artboard.screenshot({ path: pngPath });
+        pngPaths.push(pngPath);
+      }
+    } else {
+      const pngPath = join(outputPath, `${baseName}.png`);
+      await page.screenshot({ path: pngPath, fullPage: true });
       pngPaths.push(pngPath);
     }
-  } else {
-    const pngPath = join(outputPath, `${baseName}.png`);
-    await page.screenshot({ path: pngPath, fullPage: true });
-    pngPaths.push(pngPath);
-  }
 
-  // Prepare for PDF
-  await page.evaluate(() => {
-    const container = document.querySelector(".artboards-container") as HTMLElement;
-    if (container) {
-      container.style.padding = "0";
-      container.style.gap = "0";
-      container.style.background = "white";
-    }
-    const boards = document.querySelectorAll(".artboard") as NodeListOf<HTMLElement>;
-    boards.forEach((board) => {
-      board.style.marginBottom = "0";
-      board.style.boxShadow = "none";
+    // Prepare for PDF
+    await page.evaluate(() => {
+      const container = document.querySelector(".artboards-container") as HTMLElement;
+      if (container) {
+        container.style.padding = "0";
+        container.style.gap = "0";
+        container.style.background = "white";
+      }
+      const boards = document.querySelectorAll(".artboard") as NodeListOf<HTMLElement>;
+      boards.forEach((board) => {
+        board.style.marginBottom = "0";
+        board.style.boxShadow = "none";
+      });
+      document.body.style.margin = "0";
+      document.body.style.padding = "0";
     });
-    document.body.style.margin = "0";
-    document.body.style.padding = "0";
-  });
 
-  const pdfPath = join(outputPath, pageCount > 1 ? `${baseName}-all-pages.pdf` : `${baseName}.pdf`);
+    const pdfPath = join(outputPath, pageCount > 1 ? `${baseName}-all-pages.pdf` : `${baseName}.pdf`);
 
-  await page.pdf({
-    path: pdfPath,
-    width: `${size.width}in`,
-    height: `${size.height}in`,
-    printBackground: true,
-    margin: { top: "0", right: "0", bottom: "0", left: "0" },
-    preferCSSPageSize: true,
-  });
-
-  await browser.close();
+    await page.pdf({
+      path: pdfPath,
+      width: `${size.width}in`,
+      height: `${size.height}in`,
+      printBackground: true,
+      margin: { top: "0", right: "0", bottom: "0", left: "0" },
+      preferCSSPageSize: true,
+    });
 
-  return {
-    pngPaths,
-    pdfPath,
-    pages: pageCount,
-  };
+    return {
+      pngPaths,
+      pdfPath,
+      pages: pageCount,
+    };
+  } finally {
+    await context.close();
+    await releaseBrowser(browser);
+  }
 }
 
 // =============================================================================
@@ -503,6 +543,9 @@ if (cliArgs.length > 0 && cliArgs[0] !== "--mcp") {
     }
   })();
 } else {
+  // Only the server process itself shares a browser; modules that merely import
+  // this file keep self-contained exports
+  shareBrowser = !!process.argv[1] && resolve(process.argv[1]) === fileURLToPath(import.meta.url);
   const transport = new StdioServerTransport();
   server.connect(transport).catch(console.error);
 }
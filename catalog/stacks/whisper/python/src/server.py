@@ -11,6 +11,9 @@ Models download automatically on first use (~75MB - 1.5GB depending on size).
 import os
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
@@ -30,6 +33,7 @@ from faster_whisper import WhisperModel
 DEFAULT_OUTPUT_DIR = Path.home() / ".rudi" / "output"
 DEFAULT_MODEL = os.environ.get("WHISPER_MODEL", "base")
 COMPUTE_TYPE = os.environ.get("WHISPER_COMPUTE_TYPE", "int8")  # int8, float16, float32
+MAX_WORKERS = int(os.environ.get("WHISPER_WORKERS", "1"))  # concurrent transcriptions
 
 # Model sizes and approximate VRAM/RAM requirements
 MODELS = {
@@ -42,18 +46,23 @@ MODELS = {
 
 # Cached model instance
 _model_cache: dict = {}
+_model_lock = threading.Lock()
+
+# Shared pool for blocking transcriptions so the MCP event loop stays responsive
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="whisper")
 
 
 def get_model(model_size: str = DEFAULT_MODEL) -> WhisperModel:
     """Get or load a Whisper model (cached)."""
-    if model_size not in _model_cache:
-        print(f"Loading Whisper model: {model_size} (compute_type={COMPUTE_TYPE})", file=sys.stderr)
-        _model_cache[model_size] = WhisperModel(
-            model_size,
-            device="auto",  # Use GPU if available, else CPU
-            compute_type=COMPUTE_TYPE,
-        )
-    return _model_cache[model_size]
+    with _model_lock:
+        if model_size not in _model_cache:
+            print(f"Loading Whisper model: {model_size} (compute_type={COMPUTE_TYPE})", file=sys.stderr)
+            _model_cache[model_size] = WhisperModel(
+                model_size,
+                device="auto",  # Use GPU if available, else CPU
+                compute_type=COMPUTE_TYPE,
+            )
+        return _model_cache[model_size]
 
 
 def expand_path(p: str) -> Path:
@@ -267,14 +276,18 @@ async def list_tools() -> list[types.Tool]:
 async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     try:
         if name == "whisper_transcribe":
-            result = transcribe_audio(
-                audio_path=arguments["audio_path"],
-                model_size=arguments.get("model", DEFAULT_MODEL),
-                language=arguments.get("language"),
-                task=arguments.get("task", "transcribe"),
-                word_timestamps=arguments.get("word_timestamps", False),
-                output=arguments.get("output"),
-                output_format=arguments.get("output_format", "txt"),
+            result = await asyncio.get_running_loop().run_in_executor(
+                _executor,
+                partial(
+                    transcribe_audio,
+                    audio_path=arguments["audio_path"],
+                    model_size=arguments.get("model", DEFAULT_MODEL),
+                    language=arguments.get("language"),
+                    task=arguments.get("task", "transcribe"),
+                    word_timestamps=arguments.get("word_timestamps", False),
+                    output=arguments.get("output"),
+                    output_format=arguments.get("output_format", "txt"),
+                ),
             )
 
             # Format response
@@ -113,20 +113,20 @@ async function discoverManifests(): Promise<ManifestFile[]> {
     cwd: process.cwd(),
   });
 
-  const manifests: ManifestFile[] = [];
-
-  for (const file of files) {
-    if (!isV2Manifest(file)) continue;
-
-    try {
-      const manifest = (await readJson(file)) as Package;
-      manifests.push({ path: file, manifest });
-    } catch (e) {
-      console.error(`Failed to parse ${file}:`, e);
-    }
-  }
+  // Read manifests concurrently; results keep discovery order
+  const loaded = await Promise.all(
+    files.filter(isV2Manifest).map(async (file): Promise<ManifestFile | null> => {
+      try {
+        const manifest = (await readJson(file)) as Package;
+        return { path: file, manifest };
+      } catch (e) {
+        console.error(`Failed to parse ${file}:`, e);
+        return null;
+      }
+    })
+  );
 
-  return manifests;
+  return loaded.filter((m): m is ManifestFile => m !== null);
 }
 
 // =============================================================================
@@ -238,11 +238,14 @@ async function buildCatalogHash(): Promise<CatalogHash> {
     ignore: ["**/node_modules/**"],
   });
 
-  const hashes: Record<string, string> = {};
+  // Hash files concurrently, then record them in sorted order so the root is stable
+  const sorted = files.sort();
+  const digests = await Promise.all(sorted.map((file) => hashFile(file)));
 
-  for (const file of files.sort()) {
-    hashes[file] = await hashFile(file);
-  }
+  const hashes: Record<string, string> = {};
+  sorted.forEach((file, i) => {
+    hashes[file] = digests[i];
+  });
 
   // Compute root hash (hash of all hashes)
   const allHashes = Object.entries(hashes)
@@ -275,26 +278,35 @@ async function main() {
     process.exit(0);
   }
 
-  // Build base index
-  console.log("Building base index...");
-  const baseIndex = buildBaseIndex(manifests);
-  await writeJson("dist/index.json", baseIndex);
-  console.log(`  → dist/index.json (${baseIndex.stats.total} packages)`);
+  // The catalog hash tree only reads catalog files, so it is built while the
+  // indexes are built and written; both are awaited together so a failure in
+  // either reaches main().catch
+  console.log("Building indexes and catalog hash tree...");
+  const [catalogHash, { baseIndex, platformIndexes }] = await Promise.all([
+    buildCatalogHash(),
+    (async () => {
+      const baseIndex = buildBaseIndex(manifests);
+      await writeJson("dist/index.json", baseIndex);
+
+      // Platform-specific indexes are independent of each other, written concurrently
+      const platformIndexes = await Promise.all(
+        PLATFORMS.map(async ({ os, arch }) => {
+          const ctx: ResolveContext = { os, arch };
+          const platformIndex = buildPlatformIndex(manifests, ctx);
+          const filename = `dist/index.${os}-${arch}.json`;
+          await writeJson(filename, platformIndex);
+          return { filename, platformIndex };
+        })
+      );
+      return { baseIndex, platformIndexes };
+    })(),
+  ]);
+  await writeJson("dist/catalog.sha256.json", catalogHash);
 
-  // Build platform-specific indexes
-  console.log("\nBuilding platform indexes...");
-  for (const { os, arch } of PLATFORMS) {
-    const ctx: ResolveContext = { os, arch };
-    const platformIndex = buildPlatformIndex(manifests, ctx);
-    const filename = `dist/index.${os}-${arch}.json`;
-    await writeJson(filename, platformIndex);
+  console.log(`  → dist/index.json (${baseIndex.stats.total} packages)`);
+  for (const { filename, platformIndex } of platformIndexes) {
     console.log(`  → ${filename} (${platformIndex.stats.total} packages)`);
   }
-
-  // Build catalog hash tree
-  console.log("\nBuilding catalog hash tree...");
-  const catalogHash = await buildCatalogHash();
-  await writeJson("dist/catalog.sha256.json", catalogHash);
   console.log(`  → dist/catalog.sha256.json (${Object.keys(catalogHash.files).length} files)`);
   console.log(`  → root: ${catalogHash.root.slice(0, 16)}...`);
 
@@ -152,33 +152,37 @@ async function main() {
 
   console.log(`Found ${files.length} v2 manifest(s)\n`);
 
-  // Validate each file
-  const results: ValidationResult[] = [];
-  for (const file of files) {
-    if (!isV2Manifest(file)) continue;
-    const result = await validateFile(file, validate, ctx);
-    results.push(result);
-  }
+  // Validate each file (reads overlap; results keep discovery order)
+  const results: ValidationResult[] = await Promise.all(
+    files
+      .filter((file) => isV2Manifest(file))
+      .map((file) => validateFile(file, validate, ctx))
+  );
 
   // Report results
-  const passed = results.filter((r) => r.valid);
-  const failed = results.filter((r) => !r.valid);
+  const passed: ValidationResult[] = [];
+  const failed: ValidationResult[] = [];
+  for (const r of results) (r.valid ? passed : failed).push(r);
+
+  // Build the whole report and write it once
+  const out: string[] = [];
 
   for (const r of passed) {
-    console.log(`✅ ${r.id}`);
-    console.log(`   ${r.file}`);
+    out.push(`✅ ${r.id}`);
+    out.push(`   ${r.file}`);
   }
 
   for (const r of failed) {
-    console.log(`\n❌ ${r.id}`);
-    console.log(`   ${r.file}`);
+    out.push(`\n❌ ${r.id}`);
+    out.push(`   ${r.file}`);
     for (const err of r.errors ?? []) {
-      console.log(`   → ${err}`);
+      out.push(`   → ${err}`);
     }
   }
 
-  console.log(`\n${"─".repeat(60)}`);
-  console.log(`Results: ✅ ${passed.length} passed, ❌ ${failed.length} failed`);
+  out.push(`\n${"─".repeat(60)}`);
+  out.push(`Results: ✅ ${passed.length} passed, ❌ ${failed.length} failed`);
+  process.stdout.write(out.join("\n") + "\n");
 
   process.exit(failed.length > 0 ? 1 : 0);
 }